@@ -0,0 +1,182 @@
+"""
+Hot paragraph, run and table helpers for generate_docx.py.
+
+Called for every run, paragraph and table cell of a thesis. Kept separate
+and fully type-annotated so it can be compiled with mypyc
+(``mypyc _docx_fast.py``); a compiled extension next to this file is
+picked up by the normal import, and the pure Python module is the fallback.
+"""
+
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Optional
+
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Cm, Pt
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+FIRST_LINE_INDENT = Cm(0.74)  # 2 characters
+
+# Clark-notation attribute names used for every run
+_QN_EAST_ASIA = qn('w:eastAsia')
+_QN_ASCII = qn('w:ascii')
+
+
+def set_chinese_font(run: Run, font_name: str = '宋体', size: float = 12, bold: bool = False) -> None:
+    """Set Chinese font for a run"""
+    r = run._element
+    if r.rPr is None:
+        # Fresh run (the common case): insert a copy of the run properties
+        # built once for this font, instead of rebuilding them via python-docx
+        r.insert(0, deepcopy(_chinese_font_rpr(font_name, size, bold)))
+        return
+    _apply_chinese_font(run, font_name, size, bold)
+
+
+def _apply_chinese_font(run: Run, font_name: str, size: float, bold: bool) -> None:
+    """Set the font properties on a run through python-docx"""
+    run.font.name = font_name
+    run.font.size = Pt(size)
+    run.font.bold = bold
+    # Set East Asian font
+    rPr = run._element.get_or_add_rPr()
+    rFonts = OxmlElement('w:rFonts')
+    rFonts.set(_QN_EAST_ASIA, font_name)
+    rFonts.set(_QN_ASCII, font_name if font_name in ['宋体', '黑体', '楷体'] else 'Times New Roman')
+    rPr.insert(0, rFonts)
+
+
+@lru_cache(maxsize=None)
+def _chinese_font_rpr(font_name: str, size: float, bold: bool) -> Any:
+    """Build the w:rPr set_chinese_font produces for a bare run, once per font"""
+    run = Run(OxmlElement('w:r'), None)  # type: ignore[arg-type]
+    _apply_chinese_font(run, font_name, size, bold)
+    return run._element.rPr
+
+
+def add_paragraph_chinese(doc: Any, text: str, font_name: str = '宋体', size: float = 12,
+                          first_line_indent: bool = True) -> Paragraph:
+    """Add a paragraph with Chinese font"""
+    # Copy the pre-rendered paragraph for this style and only set its text
+    p = deepcopy(_body_paragraph_template(font_name, size, first_line_indent))
+    p[-1].text = text
+    append_body_elements(doc, [p])
+    return Paragraph(p, doc._body)
+
+
+def add_paragraphs_chinese(doc: Any, texts: Iterable[str], font_name: str = '宋体', size: float = 12,
+                           first_line_indent: bool = True) -> None:
+    """
+    Add one paragraph per text, styled like add_paragraph_chinese, and insert
+    them into the body together (e.g. a whole reference list).
+    """
+    template = _body_paragraph_template(font_name, size, first_line_indent)
+    paragraphs = []
+    for text in texts:
+        p = deepcopy(template)
+        p[-1].text = text
+        paragraphs.append(p)
+    append_body_elements(doc, paragraphs)
+
+
+@lru_cache(maxsize=64)
+def _body_paragraph_template(font_name: str, size: float, first_line_indent: bool) -> Any:
+    """Build the empty w:p add_paragraph_chinese copies, once per style"""
+    p = Paragraph(OxmlElement('w:p'), None)  # type: ignore[arg-type]
+    set_chinese_font(p.add_run(), font_name, size)
+
+    if first_line_indent:
+        p.paragraph_format.first_line_indent = FIRST_LINE_INDENT
+
+    p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
+    return p._p
+
+
+def iter_paragraphs(text: str, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the stripped, non-empty blocks of text[start:end] separated by
+    blank lines ('\\n\\n'), without building the list of every block first.
+    """
+    if end is None:
+        end = len(text)
+    i = start
+    while i <= end:
+        j = text.find('\n\n', i, end)
+        if j < 0:
+            j = end
+        para = text[i:j].strip()
+        if para:
+            yield para
+        i = j + 2
+
+
+def add_text_paragraphs(doc: Any, text: str, start: int = 0, end: Optional[int] = None) -> None:
+    """Add each non-empty blank-line separated block of text[start:end] as a paragraph"""
+    for para in iter_paragraphs(text, start, end):
+        add_paragraph_chinese(doc, para)
+
+
+def append_body_elements(doc: Any, elements: List[Any]) -> None:
+    """Append elements to the document body, keeping its sectPr last"""
+    body = doc.element.body
+    sectPr = body.sectPr
+    for element in elements:
+        if sectPr is not None:
+            sectPr.addprevious(element)
+        else:
+            body.append(element)
+
+
+def add_blank_paragraphs(doc: Any, count: int = 1) -> None:
+    """Add empty spacer paragraphs as bare w:p elements, without python-docx wrappers"""
+    append_body_elements(doc, [OxmlElement('w:p') for _ in range(count)])
+
+
+def fill_cell(tc: Any, text: str, font_name: str, size: float, alignment: WD_ALIGN_PARAGRAPH) -> None:
+    """Replace the content of a w:tc with one aligned paragraph of text in the given font"""
+    tc.clear_content()
+    p = deepcopy(_cell_paragraph_template(font_name, size, alignment))
+    p[-1].text = text
+    tc.append(p)
+
+
+@lru_cache(maxsize=None)
+def _cell_paragraph_template(font_name: str, size: float, alignment: WD_ALIGN_PARAGRAPH) -> Any:
+    """Build the empty cell paragraph fill_cell copies, once per font and alignment"""
+    p = Paragraph(OxmlElement('w:p'), None)  # type: ignore[arg-type]
+    set_chinese_font(p.add_run(), font_name, size)
+    p.alignment = alignment
+    return p._p
+
+
+def add_table_from_data(doc: Any, table_data: dict, style: str = 'Table Grid') -> Optional[Table]:
+    """Add a table from extracted table data"""
+    rows: List[list] = table_data.get('rows', [])
+    if not rows:
+        return None
+
+    row_count = len(rows)
+    col_count = max(len(row) for row in rows) if rows else 0
+
+    if row_count == 0 or col_count == 0:
+        return None
+
+    table = doc.add_table(rows=row_count, cols=col_count)
+    table.style = style
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+
+    # Fill the cells at the XML level: a fresh table has exactly one w:tc
+    # per column in every row, so no python-docx cell wrappers are needed
+    for tr, row_data in zip(table._tbl.tr_lst, rows):
+        for tc, cell_text in zip(tr.tc_lst, row_data):
+            fill_cell(tc, str(cell_text), '宋体', 10, WD_ALIGN_PARAGRAPH.CENTER)
+
+    # Add spacing after table
+    add_blank_paragraphs(doc)
+
+    return table
@@ -0,0 +1,309 @@
+"""
+Text post-processing for PDF extraction output: marks formulas and
+table-like line sequences in the extracted text.
+
+Kept free of PyMuPDF and fully type-annotated so it can be compiled with
+mypyc (``mypyc _text_postproc.py``); a compiled extension next to this
+file is picked up by the normal import, and the pure Python module is
+the fallback.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, List
+
+# Unicode math symbols that indicate potential formulas
+UNICODE_MATH_CHARS = frozenset('𝛼𝛽𝛾𝛿𝜀𝜁𝜂𝜃𝜄𝜅𝜆𝜇𝜈𝜉𝜊𝜋𝜌𝜎𝜏𝜐𝜑𝜒𝜓𝜔'
+                               '𝛢𝛣𝛤𝛥𝛦𝛧𝛨𝛩𝛪𝛫𝛬𝛭𝛮𝛯𝛰𝛱𝛲𝛳𝛴𝛵𝛶𝛷𝛸𝛹𝛺'
+                               '𝑎𝑏𝑐𝑑𝑒𝑓𝑔ℎ𝑖𝑗𝑘𝑙𝑚𝑛𝑜𝑝𝑞𝑟𝑠𝑡𝑢𝑣𝑤𝑥𝑦𝑧'
+                               '𝐴𝐵𝐶𝐷𝐸𝐹𝐺𝐻𝐼𝐽𝐾𝐿𝑀𝑁𝑂𝑃𝑄𝑅𝑆𝑇𝑈𝑉𝑊𝑋𝑌𝑍'
+                               '⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻⁼⁽⁾ⁿⁱ₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎'
+                               '∑∏∫∬∭∮∯∰∇∂∆∀∃∈∉⊂⊃⊆⊇∪∩∧∨¬⊕⊗⊙'
+                               '≤≥≠≈≡≢∝∞±×÷√∛∜')
+
+# Translation table deleting every math character: the count of math
+# characters in a line is its length drop after translate(), done in C
+_MATH_CHARS_DELETE = str.maketrans('', '', ''.join(UNICODE_MATH_CHARS))
+
+# Symbols that mark a line as a formula on their own
+_MATH_SYMBOLS = frozenset('∑∏∫∂∇=±×÷')
+
+# Line-classification patterns, compiled once instead of per call
+_FORMULA_EQ = re.compile(r'^[𝑎-𝑧𝐴-𝑍a-zA-Z]=')
+_SUB_EQ = re.compile(r'^[𝑖𝑗𝑘ijk]=\d')
+_SECTION_HDR = re.compile(r'^[\d]+\.\d+\s+.+$')
+_NUM_LIST = re.compile(r'^[\d]+[.、]\s+.{5,}')
+_NUMERIC = re.compile(r'^[\d,.\-+%]+$')
+_DATASET = re.compile(r'^[A-Za-z][\w\-]+$')
+_ENG_HDR = re.compile(r'^[A-Za-z][A-Za-z\s\-]{0,40}$')
+_CJK = re.compile(r'^[\u4e00-\u9fa5]+')
+_PCT = re.compile(r'^[\d,.]+%$')
+_NUM_ONLY = re.compile(r'^[\d,.]+$')
+
+# Line labels used by detect_table_structure (bit flags)
+_LINE_TEXT = 0
+_LINE_CELL = 1       # Could be a single table cell (one cell per line)
+_LINE_MULTICOL = 2   # Several space-separated columns, at least one numeric
+_LINE_NATIVE = 4     # Inside a [TABLE_START]...[TABLE_END] block from find_tables()
+_LINE_NUMERIC = 8    # Whole line matches _NUMERIC (e.g. "-3.5%", "50,000")
+_LINE_NUM_ONLY = 16  # Whole line matches _NUM_ONLY (digits, commas and dots)
+
+
+@lru_cache(maxsize=8192)
+def is_formula_line(line: str) -> bool:
+    """Check if a line is part of a formula"""
+    stripped = line.strip()
+    if not stripped:
+        return False
+
+    # Fast path for plain ASCII lines: none of the math characters are ASCII,
+    # and '=' is the only ASCII formula symbol (both equation patterns need it)
+    if stripped.isascii():
+        return '=' in stripped
+
+    # Set operations run in C; most lines contain no math characters at all,
+    # so the count below is only needed for the rest
+    chars = set(stripped)
+
+    # Count Unicode math characters
+    if chars.isdisjoint(UNICODE_MATH_CHARS):
+        math_count = 0
+    else:
+        math_count = len(stripped) - len(stripped.translate(_MATH_CHARS_DELETE))
+
+    # Check for formula indicators
+    has_math_symbol = not _MATH_SYMBOLS.isdisjoint(chars)
+    has_significant_math = math_count >= 2
+
+    # Short lines with math chars (like "𝑁", "𝑖=1", "𝐿= −")
+    is_short_math = len(stripped) <= 10 and math_count >= 1
+
+    # Lines that look like formula parts
+    is_formula_part = _FORMULA_EQ.match(stripped) is not None
+    is_subscript_part = _SUB_EQ.match(stripped) is not None
+
+    return has_math_symbol or has_significant_math or is_short_math or is_formula_part or is_subscript_part
+
+
+def iter_lines(fragments: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the lines of "".join(fragments).split('\n') without building the
+    joined text. Only fragments that contain a newline are split.
+    """
+    pending: List[str] = []
+    for fragment in fragments:
+        if '\n' not in fragment:
+            pending.append(fragment)
+            continue
+        pieces = fragment.split('\n')
+        pending.append(pieces[0])
+        yield ''.join(pending)
+        yield from pieces[1:-1]
+        pending = [pieces[-1]]
+    yield ''.join(pending)
+
+
+def mark_formulas(fragments: Iterable[str]) -> List[str]:
+    """
+    Detect and mark potential formulas containing Unicode math symbols.
+    Groups consecutive formula lines into a single block.
+
+    Takes the raw text fragments and returns the marked text as a list of lines.
+    """
+    result: List[str] = []
+    formula_buffer: List[str] = []
+
+    def flush_formula_buffer() -> None:
+        """Output the formula buffer as a single block"""
+        nonlocal formula_buffer
+        if not formula_buffer:
+            return
+
+        if len(formula_buffer) == 1:
+            # Single line formula
+            result.append(f'[FORMULA: {formula_buffer[0].strip()} :END_FORMULA]')
+        else:
+            # Multi-line formula block - join with special separator
+            content = ' '.join(line.strip() for line in formula_buffer if line.strip())
+            result.append(f'[FORMULA_BLOCK: {content} :END_FORMULA_BLOCK]')
+
+        formula_buffer = []
+
+    for line in iter_lines(fragments):
+        stripped = line.strip()
+
+        if is_formula_line(stripped):
+            formula_buffer.append(line)
+        else:
+            # Not a formula line
+            if formula_buffer:
+                # Check if this non-formula line is "其中" which often follows formulas
+                if stripped.startswith('其中') and not UNICODE_MATH_CHARS.isdisjoint(stripped):
+                    formula_buffer.append(line)
+                    continue
+
+                flush_formula_buffer()
+
+            result.append(line)
+
+    # Flush any remaining formula content
+    flush_formula_buffer()
+
+    return result
+
+
+@lru_cache(maxsize=8192)
+def is_table_cell_candidate(line: str) -> bool:
+    """Check if a line looks like a single table cell from PDF extraction"""
+    stripped = line.strip()
+    if not stripped or len(stripped) > 100:  # Empty or too long for a cell
+        return False
+    # Exclude section headers (e.g., "4.2 实验结果", "第一章")
+    if _SECTION_HDR.match(stripped) or stripped.startswith('第'):
+        return False
+    # Exclude numbered list items (e.g., "1. xxx", "• xxx")
+    if _NUM_LIST.match(stripped) or stripped.startswith(('•', '–')):
+        return False
+    # Check for numeric patterns (including comma-separated numbers like "50,000")
+    if _NUMERIC.match(stripped) and len(stripped) >= 1:
+        return True
+    # Dataset names like CIFAR-10, ImageNet
+    if _DATASET.match(stripped) and len(stripped) <= 15:
+        return True
+    # Short Chinese text that could be a header (not ending with sentence punctuation)
+    if len(stripped) <= 10 and not stripped.endswith(('。', '：', '；')):
+        return True
+    # Medium-length English text (headers like "Accuracy", "Model Parameters")
+    if _ENG_HDR.match(stripped):
+        return True
+    # Chinese text up to 20 chars
+    if len(stripped) <= 20 and _CJK.match(stripped):
+        return True
+    # Percentage values
+    if _PCT.match(stripped):
+        return True
+    return False
+
+
+def _classify_table_line(stripped: str) -> int:
+    """Label a stripped line with _LINE_* flags for detect_table_structure."""
+    label = _LINE_CELL if is_table_cell_candidate(stripped) else _LINE_TEXT
+    parts = stripped.split()
+    if len(parts) >= 3 and any(_NUM_ONLY.match(p) for p in parts):
+        label |= _LINE_MULTICOL
+    if _NUMERIC.match(stripped):
+        label |= _LINE_NUMERIC
+        if _NUM_ONLY.match(stripped):
+            label |= _LINE_NUM_ONLY
+    return label
+
+
+def looks_like_table_sequence(buffer: List[str], num_count: int) -> bool:
+    """
+    Check if a sequence of lines looks like table data.
+
+    num_count is the number of numeric entries in buffer, counted by the
+    caller as lines are buffered.
+    """
+    if len(buffer) < 4:  # Need at least header row + 1 data row (assuming 2+ cols)
+        return False
+    # Should have at least one number or enough cells
+    return num_count >= 1 or len(buffer) >= 4
+
+
+def detect_table_structure(lines: List[str]) -> List[str]:
+    """
+    Detect potential table data based on patterns:
+    - Multiple numbers/values separated by spaces on a line
+    - Lines with consistent columnar structure
+    - PDF-extracted tables where each cell is on its own line
+
+    Takes and returns the text as a list of lines.
+    """
+    result: List[str] = []
+    table_buffer: List[str] = []
+    # Numeric / numbers-only entries in table_buffer, kept in step with it
+    table_numeric_count = 0
+    table_num_only_count = 0
+    in_potential_table = False
+
+    # Classify every line once up front so the loop (and its one-line
+    # lookahead) only reads labels. Blocks already emitted by PyMuPDF's native
+    # table detection are not classified at all: as _LINE_NATIVE they fall
+    # through to the plain-line branch below and are copied verbatim.
+    stripped_lines = [line.strip() for line in lines]
+    labels: List[int] = []
+    in_native_table = False
+    for stripped in stripped_lines:
+        if stripped == '[TABLE_START]':
+            in_native_table = True
+        if in_native_table:
+            labels.append(_LINE_NATIVE)
+            in_native_table = stripped != '[TABLE_END]'
+        else:
+            labels.append(_classify_table_line(stripped))
+
+    for i, line in enumerate(lines):
+        stripped = stripped_lines[i]
+        label = labels[i]
+
+        # Check if this looks like a table row (multi-column per line)
+        looks_like_multi_col_row = label & _LINE_MULTICOL
+
+        # Check if this looks like a single table cell (PDF extraction pattern)
+        looks_like_single_cell = label & _LINE_CELL
+
+        if looks_like_multi_col_row:
+            # Traditional table row with multiple columns
+            if not in_potential_table:
+                in_potential_table = True
+            buffered = True
+        elif looks_like_single_cell and (in_potential_table or len(table_buffer) > 0):
+            # Continue collecting potential table cells
+            if not in_potential_table:
+                in_potential_table = True
+            buffered = True
+        elif looks_like_single_cell and i + 1 < len(lines) and labels[i + 1] & _LINE_CELL:
+            # Start of a potential table sequence
+            in_potential_table = True
+            buffered = True
+        else:
+            buffered = False
+
+        if buffered:
+            table_buffer.append(stripped)
+            if label & _LINE_NUMERIC:
+                table_numeric_count += 1
+                if label & _LINE_NUM_ONLY:
+                    table_num_only_count += 1
+        else:
+            if in_potential_table and len(table_buffer) >= 2:
+                # Check if it looks like a real table
+                if looks_like_table_sequence(table_buffer, table_numeric_count) or table_num_only_count:
+                    # Mark the buffered content as a table
+                    result.append('[TABLE_START]')
+                    for row in table_buffer:
+                        result.append(f'[TABLE_CELL: {row}]')
+                    result.append('[TABLE_END]')
+                else:
+                    # Not enough table-like content, output normally
+                    result.extend(table_buffer)
+                table_buffer = []
+            elif table_buffer:
+                # Not enough rows to be a table, just output normally
+                result.extend(table_buffer)
+                table_buffer = []
+            table_numeric_count = table_num_only_count = 0
+            in_potential_table = False
+            result.append(line)
+
+    # Handle remaining buffer
+    if len(table_buffer) >= 2 and looks_like_table_sequence(table_buffer, table_numeric_count):
+        result.append('[TABLE_START]')
+        for row in table_buffer:
+            result.append(f'[TABLE_CELL: {row}]')
+        result.append('[TABLE_END]')
+    elif table_buffer:
+        result.extend(table_buffer)
+
+    return result
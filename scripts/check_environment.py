@@ -80,6 +80,20 @@ def main():
             failed(f"{pkg_name} - {description}")
             info(f"  Install: pip3 install {pkg_name}")
 
+    optional_packages = [
+        ("orjson", "orjson", "Faster JSON encoding (optional)"),
+        ("msgspec", "msgspec", "Schema-based thesis JSON decoding (optional)"),
+    ]
+
+    for pkg_name, import_name, description in optional_packages:
+        try:
+            module = __import__(import_name)
+            version = getattr(module, '__version__', 'unknown')
+            passed(f"{pkg_name} {version} - {description}")
+        except ImportError:
+            warning(f"{pkg_name} - {description}")
+            info(f"  Install: pip3 install {pkg_name}")
+
     # ===========================================
     # 3. PyMuPDF Detailed Check
     # ===========================================
@@ -7,87 +7,29 @@ Extracts text with image position markers for LLM processing
 import sys
 import json
 import os
-import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import fitz  # PyMuPDF
 
-# Unicode math symbols that indicate potential formulas
-UNICODE_MATH_CHARS = set('𝛼𝛽𝛾𝛿𝜀𝜁𝜂𝜃𝜄𝜅𝜆𝜇𝜈𝜉𝜊𝜋𝜌𝜎𝜏𝜐𝜑𝜒𝜓𝜔'
-                         '𝛢𝛣𝛤𝛥𝛦𝛧𝛨𝛩𝛪𝛫𝛬𝛭𝛮𝛯𝛰𝛱𝛲𝛳𝛴𝛵𝛶𝛷𝛸𝛹𝛺'
-                         '𝑎𝑏𝑐𝑑𝑒𝑓𝑔ℎ𝑖𝑗𝑘𝑙𝑚𝑛𝑜𝑝𝑞𝑟𝑠𝑡𝑢𝑣𝑤𝑥𝑦𝑧'
-                         '𝐴𝐵𝐶𝐷𝐸𝐹𝐺𝐻𝐼𝐽𝐾𝐿𝑀𝑁𝑂𝑃𝑄𝑅𝑆𝑇𝑈𝑉𝑊𝑋𝑌𝑍'
-                         '⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻⁼⁽⁾ⁿⁱ₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎'
-                         '∑∏∫∬∭∮∯∰∇∂∆∀∃∈∉⊂⊃⊆⊇∪∩∧∨¬⊕⊗⊙'
-                         '≤≥≠≈≡≢∝∞±×÷√∛∜')
+from _text_postproc import (
+    detect_table_structure,
+    is_formula_line,
+    is_table_cell_candidate,
+    mark_formulas,
+)
 
-def is_formula_line(line: str) -> bool:
-    """Check if a line is part of a formula"""
-    stripped = line.strip()
-    if not stripped:
-        return False
+try:
+    import orjson  # Optional: faster JSON output
+except ImportError:
+    orjson = None
 
-    # Count Unicode math characters
-    math_count = sum(1 for c in stripped if c in UNICODE_MATH_CHARS)
+# Page extraction is fanned out to worker processes for longer documents
+MAX_WORKERS = 8
+PARALLEL_MIN_PAGES = 8  # Below this, process startup outweighs the gain
 
-    # Check for formula indicators
-    has_math_symbol = any(c in stripped for c in '∑∏∫∂∇=±×÷')
-    has_significant_math = math_count >= 2
-
-    # Short lines with math chars (like "𝑁", "𝑖=1", "𝐿= −")
-    is_short_math = len(stripped) <= 10 and math_count >= 1
-
-    # Lines that look like formula parts
-    is_formula_part = re.match(r'^[𝑎-𝑧𝐴-𝑍a-zA-Z]=', stripped) is not None
-    is_subscript_part = re.match(r'^[𝑖𝑗𝑘ijk]=\d', stripped) is not None
-
-    return has_math_symbol or has_significant_math or is_short_math or is_formula_part or is_subscript_part
-
-
-def mark_formulas(text: str) -> str:
-    """
-    Detect and mark potential formulas containing Unicode math symbols.
-    Groups consecutive formula lines into a single block.
-    """
-    lines = text.split('\n')
-    result = []
-    formula_buffer = []
-
-    def flush_formula_buffer():
-        """Output the formula buffer as a single block"""
-        nonlocal formula_buffer
-        if not formula_buffer:
-            return
-
-        if len(formula_buffer) == 1:
-            # Single line formula
-            result.append(f'[FORMULA: {formula_buffer[0].strip()} :END_FORMULA]')
-        else:
-            # Multi-line formula block - join with special separator
-            content = ' '.join(line.strip() for line in formula_buffer if line.strip())
-            result.append(f'[FORMULA_BLOCK: {content} :END_FORMULA_BLOCK]')
-
-        formula_buffer = []
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        if is_formula_line(line):
-            formula_buffer.append(line)
-        else:
-            # Not a formula line
-            if formula_buffer:
-                # Check if this non-formula line is "其中" which often follows formulas
-                if stripped.startswith('其中') and any(c in stripped for c in UNICODE_MATH_CHARS):
-                    formula_buffer.append(line)
-                    continue
-
-                flush_formula_buffer()
-
-            result.append(line)
-
-    # Flush any remaining formula content
-    flush_formula_buffer()
-
-    return '\n'.join(result)
+# Lines of text serialized per write when streaming the JSON output
+JSON_CHUNK_LINES = 1024
 
 
 def extract_tables_with_pymupdf(page) -> list:
@@ -120,229 +62,280 @@ def format_table_as_markers(table_data: dict) -> str:
     lines.append('[TABLE_END]')
     return '\n'.join(lines)
 
+def _extract_page(doc, page, page_num: int, output_dir: str, xref_cache: dict) -> list:
+    """
+    Extract one page as an ordered list of parts.
+
+    Text (and formatted table markers) are plain strings. Image blocks are
+    dicts so the caller can assign document-wide image ids once all pages
+    are done; extracted images are saved under a page-scoped temporary name.
+    xref_cache maps already-saved image xrefs to their (filename, ext).
+    """
+    parts = []
+
+    # Extract tables using PyMuPDF native detection
+    page_tables = extract_tables_with_pymupdf(page)
+
+    # Get all blocks (text and images). Text is joined from the "dict"
+    # spans: the ready-made "blocks" strings are not equivalent (they keep
+    # stray glyphs, e.g. a U+1939 after "作者，" in the SCUT template, that
+    # the span text does not contain)
+    blocks = page.get_text("dict")["blocks"]
+
+    if any(block["type"] == 1 for block in blocks):
+        # Get image info with xrefs for extraction. get_image_info() has to
+        # run the page's content stream, so only pages with image blocks
+        # (including inline images, which get_images() does not list) ask
+        image_info_list = page.get_image_info(xrefs=True)
+        _append_layout_blocks(doc, blocks, page_num, output_dir, image_info_list, xref_cache, parts)
+    else:
+        for block in sorted(blocks, key=lambda b: b["bbox"][1]):
+            parts.append(_block_text(block))
+
+    # Insert formatted table markers from PyMuPDF native detection
+    for table in sorted(page_tables, key=lambda t: t['bbox'][1]):
+        parts.append(f"\n{format_table_as_markers(table)}\n")
 
-def detect_table_structure(text: str) -> str:
+    return parts
+
+
+def _block_text(block: dict) -> str:
+    """Text of a "dict" text block: the spans of each line joined, every line ending in a newline."""
+    return "".join(
+        "".join([span["text"] for span in line["spans"]]) + "\n"
+        for line in block["lines"]
+    )
+
+
+def _append_layout_blocks(doc, blocks: list, page_num: int, output_dir: str,
+                          image_info_list: list, xref_cache: dict, parts: list) -> None:
     """
-    Detect potential table data based on patterns:
-    - Multiple numbers/values separated by spaces on a line
-    - Lines with consistent columnar structure
-    - PDF-extracted tables where each cell is on its own line
+    Append text and image parts of a page that contains images, in layout order.
+
+    blocks are the page's get_text("dict") blocks, text and images.
     """
-    lines = text.split('\n')
-    result = []
-    table_buffer = []
-    in_potential_table = False
-
-    def is_table_cell_candidate(line: str) -> bool:
-        """Check if a line looks like a single table cell from PDF extraction"""
-        stripped = line.strip()
-        if not stripped or len(stripped) > 100:  # Empty or too long for a cell
-            return False
-        # Exclude section headers (e.g., "4.2 实验结果", "第一章")
-        if re.match(r'^[\d]+\.\d+\s+.+$', stripped) or stripped.startswith('第'):
-            return False
-        # Exclude numbered list items (e.g., "1. xxx", "• xxx")
-        if re.match(r'^[\d]+[.、]\s+.{5,}', stripped) or stripped.startswith(('•', '–')):
-            return False
-        # Check for numeric patterns (including comma-separated numbers like "50,000")
-        if re.match(r'^[\d,.\-+%]+$', stripped) and len(stripped) >= 1:
-            return True
-        # Dataset names like CIFAR-10, ImageNet
-        if re.match(r'^[A-Za-z][\w\-]+$', stripped) and len(stripped) <= 15:
-            return True
-        # Short Chinese text that could be a header (not ending with sentence punctuation)
-        if len(stripped) <= 10 and not stripped.endswith(('。', '：', '；')):
-            return True
-        # Medium-length English text (headers like "Accuracy", "Model Parameters")
-        if re.match(r'^[A-Za-z][A-Za-z\s\-]{0,40}$', stripped):
-            return True
-        # Chinese text up to 20 chars
-        if len(stripped) <= 20 and re.match(r'^[\u4e00-\u9fa5]+', stripped):
-            return True
-        # Percentage values
-        if re.match(r'^[\d,.]+%$', stripped):
-            return True
-        return False
-
-    def looks_like_table_sequence(buffer: list) -> bool:
-        """Check if a sequence of lines looks like table data"""
-        if len(buffer) < 4:  # Need at least header row + 1 data row (assuming 2+ cols)
-            return False
-        # Count numeric entries
-        num_count = sum(1 for line in buffer if re.match(r'^[\d,.\-+%]+$', line.strip()))
-        # Should have at least one number or enough cells
-        return num_count >= 1 or len(buffer) >= 4
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        # Check if this looks like a table row (multi-column per line)
-        parts = stripped.split()
-        has_numbers = any(re.match(r'^[\d,.]+$', p) for p in parts)
-        looks_like_multi_col_row = len(parts) >= 3 and has_numbers
-
-        # Check if this looks like a single table cell (PDF extraction pattern)
-        looks_like_single_cell = is_table_cell_candidate(stripped)
-
-        if looks_like_multi_col_row:
-            # Traditional table row with multiple columns
-            if not in_potential_table:
-                in_potential_table = True
-            table_buffer.append(stripped)
-        elif looks_like_single_cell and (in_potential_table or len(table_buffer) > 0):
-            # Continue collecting potential table cells
-            if not in_potential_table:
-                in_potential_table = True
-            table_buffer.append(stripped)
-        elif looks_like_single_cell and i + 1 < len(lines) and is_table_cell_candidate(lines[i + 1]):
-            # Start of a potential table sequence
-            in_potential_table = True
-            table_buffer.append(stripped)
-        else:
-            if in_potential_table and len(table_buffer) >= 2:
-                # Check if it looks like a real table
-                if looks_like_table_sequence(table_buffer) or any(re.match(r'^[\d,.]+$', l.strip()) for l in table_buffer):
-                    # Mark the buffered content as a table
-                    result.append('[TABLE_START]')
-                    for row in table_buffer:
-                        result.append(f'[TABLE_CELL: {row}]')
-                    result.append('[TABLE_END]')
-                else:
-                    # Not enough table-like content, output normally
-                    result.extend(table_buffer)
-                table_buffer = []
-            elif table_buffer:
-                # Not enough rows to be a table, just output normally
-                result.extend(table_buffer)
-                table_buffer = []
-            in_potential_table = False
-            result.append(line)
-
-    # Handle remaining buffer
-    if len(table_buffer) >= 2 and looks_like_table_sequence(table_buffer):
-        result.append('[TABLE_START]')
-        for row in table_buffer:
-            result.append(f'[TABLE_CELL: {row}]')
-        result.append('[TABLE_END]')
-    elif table_buffer:
-        result.extend(table_buffer)
-
-    return '\n'.join(result)
+    # Image centers sorted by y, for nearest-neighbour matching of image blocks
+    image_centers = sorted(
+        (((info["bbox"][1] + info["bbox"][3]) / 2, info) for info in image_info_list),
+        key=lambda c: c[0],
+    )
+    center_ys = [c[0] for c in image_centers]
+    center_infos = [c[1] for c in image_centers]
+
+    # Sort blocks by y coordinate (top to bottom)
+    sorted_blocks = sorted(blocks, key=lambda b: b["bbox"][1])
+
+    local_idx = 0
+    for block in sorted_blocks:
+        bbox = block["bbox"]
+
+        if block["type"] == 0:  # Text block
+            parts.append(_block_text(block))
+
+        elif block["type"] == 1:  # Image block
+            local_idx += 1
+            image = {"bbox": list(bbox), "status": None}
+            parts.append(image)
+
+            # Try to find matching image info by bbox proximity
+            block_center_y = (bbox[1] + bbox[3]) / 2
+            matched_img = _nearest_image(center_ys, center_infos, block_center_y)
+
+            # Extract and save image
+            if matched_img and matched_img.get("xref", 0) > 0:
+                try:
+                    xref = matched_img["xref"]
+                    if xref not in xref_cache:
+                        # First use of this image stream: decode and save it once;
+                        # repeated logos/decorations reuse the same file
+                        img_data = doc.extract_image(xref)
+                        ext = img_data.get("ext", "png")
+                        filename = f"p{page_num}_img{local_idx}.{ext}"
+                        img_path = os.path.join(output_dir, filename)
+
+                        _write_image_file(img_path, img_data["image"])
+                        xref_cache[xref] = (filename, ext)
+
+                    image["filename"], image["ext"] = xref_cache[xref]
+
+                except Exception as e:
+                    # If extraction fails, still add marker but note the error
+                    image["status"] = "extraction_failed"
+                    sys.stderr.write(
+                        f"Warning: Failed to extract image {local_idx} on page {page_num + 1}: {e}\n"
+                    )
+            else:
+                # Image block found but no xref match
+                image["status"] = "no_xref"
+
+
+def _write_image_file(path: str, data: bytes) -> None:
+    """Write image bytes with a raw file descriptor, bypassing buffered IO."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _nearest_image(center_ys: list, infos: list, y: float, tolerance: float = 50):
+    """Return the image info whose center is closest to y (within tolerance pt), or None."""
+    i = bisect_left(center_ys, y)
+    matched = None
+    min_distance = tolerance
+    # Only the neighbours around the insertion point can be the closest
+    for j in (i - 1, i):
+        if 0 <= j < len(center_ys):
+            distance = abs(center_ys[j] - y)
+            if distance < min_distance:
+                min_distance = distance
+                matched = infos[j]
+    return matched
+
+
+def _extract_page_range(pdf_path: str, output_dir: str, page_nums: range) -> list:
+    """Extract a contiguous slice of pages; runs inside a worker process."""
+    doc = fitz.open(pdf_path)
+    xref_cache = {}
+    try:
+        return [(page_num, _extract_page(doc, doc[page_num], page_num, output_dir, xref_cache))
+                for page_num in page_nums]
+    finally:
+        doc.close()
+
+
+def _split_pages(page_count: int, workers: int) -> list:
+    """Split page indices into at most `workers` contiguous, near-equal slices."""
+    size, extra = divmod(page_count, workers)
+    slices = []
+    start = 0
+    for i in range(workers):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            slices.append(range(start, stop))
+        start = stop
+    return slices
 
 
 def extract_pdf_with_layout(pdf_path: str, output_dir: str) -> dict:
     """
     Extract PDF content with image position information.
 
+    Pages are extracted in parallel worker processes for longer documents
+    (fitz documents cannot be shared across processes, so every worker opens
+    its own handle) and merged back in page order.
+
     Args:
         pdf_path: Path to the PDF file
         output_dir: Directory to save extracted images
 
     Returns:
-        dict with text_with_images and images list
+        dict with text_lines (the lines of text_with_images, joined only
+        when serialized by write_json) and images list
     """
+    # The line classifiers are memoized; keep the caches per document
+    is_formula_line.cache_clear()
+    is_table_cell_candidate.cache_clear()
+
     doc = fitz.open(pdf_path)
+    page_count = doc.page_count
+    doc.close()
+
     result = {
-        "text_with_images": "",
+        "text_lines": [],
         "images": []
     }
+    # Collected fragments are split into lines once at the end; repeated
+    # str += would copy the whole text again for every block
+    text_parts = []
+
+    workers = min(os.cpu_count() or 1, MAX_WORKERS)
+    if workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                partial(_extract_page_range, pdf_path, output_dir),
+                _split_pages(page_count, workers),
+            )
+            pages = [page for chunk in chunks for page in chunk]
+    else:
+        pages = _extract_page_range(pdf_path, output_dir, range(page_count))
 
     image_counter = 0
+    saved_files = {}  # page-scoped filename -> final filename
+
+    for page_num, parts in pages:
+        for part in parts:
+            if isinstance(part, str):
+                text_parts.append(part)
+                continue
+
+            image_counter += 1
+            img_id = f"pdfimg{image_counter}"
+
+            if part["status"]:
+                text_parts.append(f"\n[FIGURE:{img_id}:{part['status']}]\n")
+                continue
+
+            # Give the page-scoped file its document-wide name; blocks that
+            # share an image xref share the file saved for the first one
+            filename = saved_files.get(part["filename"])
+            if filename is None:
+                filename = f"{img_id}.{part['ext']}"
+                os.replace(os.path.join(output_dir, part["filename"]),
+                           os.path.join(output_dir, filename))
+                saved_files[part["filename"]] = filename
+
+            result["images"].append({
+                "id": img_id,
+                "filename": filename,
+                "page": page_num + 1,
+                "bbox": part["bbox"]
+            })
+
+            # Insert image marker in text
+            text_parts.append(f"\n[FIGURE:{img_id}]\n")
 
-    for page_num, page in enumerate(doc):
-        # Extract tables using PyMuPDF native detection
-        page_tables = extract_tables_with_pymupdf(page)
-        table_bboxes = [t['bbox'] for t in page_tables]
-
-        # Get all blocks (text and images)
-        blocks = page.get_text("dict")["blocks"]
-
-        # Get image info with xrefs for extraction
-        image_info_list = page.get_image_info(xrefs=True)
-
-        # Create a mapping of bbox to image info
-        # Use center point for matching
-        image_map = {}
-        for img_info in image_info_list:
-            bbox = img_info["bbox"]
-            center_y = (bbox[1] + bbox[3]) / 2
-            image_map[center_y] = img_info
-
-        # Sort blocks by y coordinate (top to bottom)
-        sorted_blocks = sorted(blocks, key=lambda b: b["bbox"][1])
-
-        for block in sorted_blocks:
-            bbox = block["bbox"]
-
-            if block["type"] == 0:  # Text block
-                block_text = ""
-                for line in block["lines"]:
-                    line_text = ""
-                    for span in line["spans"]:
-                        line_text += span["text"]
-                    block_text += line_text + "\n"
-                result["text_with_images"] += block_text
-
-            elif block["type"] == 1:  # Image block
-                image_counter += 1
-                img_id = f"pdfimg{image_counter}"
-
-                # Try to find matching image info by bbox proximity
-                block_center_y = (bbox[1] + bbox[3]) / 2
-                matched_img = None
-                min_distance = float('inf')
-
-                for center_y, img_info in image_map.items():
-                    distance = abs(center_y - block_center_y)
-                    if distance < min_distance and distance < 50:  # 50pt tolerance
-                        min_distance = distance
-                        matched_img = img_info
-
-                # Extract and save image
-                if matched_img and matched_img.get("xref", 0) > 0:
-                    try:
-                        xref = matched_img["xref"]
-                        img_data = doc.extract_image(xref)
-                        ext = img_data.get("ext", "png")
-                        filename = f"{img_id}.{ext}"
-                        img_path = os.path.join(output_dir, filename)
-
-                        with open(img_path, "wb") as f:
-                            f.write(img_data["image"])
-
-                        result["images"].append({
-                            "id": img_id,
-                            "filename": filename,
-                            "page": page_num + 1,
-                            "bbox": list(bbox)
-                        })
+        # Add page separator
+        if page_num < page_count - 1:
+            text_parts.append("\n\n")
 
-                        # Insert image marker in text
-                        result["text_with_images"] += f"\n[FIGURE:{img_id}]\n"
+    # Post-process to mark formulas and tables
+    lines = mark_formulas(text_parts)
+    result["text_lines"] = detect_table_structure(lines)
 
-                    except Exception as e:
-                        # If extraction fails, still add marker but note the error
-                        result["text_with_images"] += f"\n[FIGURE:{img_id}:extraction_failed]\n"
-                        sys.stderr.write(f"Warning: Failed to extract image {img_id}: {e}\n")
-                else:
-                    # Image block found but no xref match
-                    result["text_with_images"] += f"\n[FIGURE:{img_id}:no_xref]\n"
+    return result
 
-        # Insert formatted table markers from PyMuPDF native detection
-        for table in sorted(page_tables, key=lambda t: t['bbox'][1]):
-            result["text_with_images"] += f"\n{format_table_as_markers(table)}\n"
 
-        # Add page separator
-        if page_num < len(doc) - 1:
-            result["text_with_images"] += "\n\n"
+def _dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
-    doc.close()
 
-    # Post-process to mark formulas and tables
-    result["text_with_images"] = mark_formulas(result["text_with_images"])
-    result["text_with_images"] = detect_table_structure(result["text_with_images"])
+def write_json(result: dict) -> None:
+    """
+    Write {"text_with_images", "images"} as one line of UTF-8 JSON to stdout.
 
-    return result
+    The text is streamed as escaped chunks of JSON_CHUNK_LINES lines, so the
+    full text is never held in memory as one string (let alone twice, as a
+    str and its serialized copy).
+    """
+    lines = result["text_lines"]
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    out.write(b'{"text_with_images":"')
+    for start in range(0, len(lines), JSON_CHUNK_LINES):
+        if start:
+            out.write(b"\\n")
+        # A JSON string of the chunk, without its surrounding quotes
+        out.write(_dumps("\n".join(lines[start:start + JSON_CHUNK_LINES]))[1:-1])
+    out.write(b'","images":')
+    out.write(_dumps(result["images"]))
+    out.write(b"}\n")
+    out.flush()
 
 
 def main():
@@ -361,7 +354,7 @@ def main():
 
     try:
         result = extract_pdf_with_layout(pdf_path, output_dir)
-        print(json.dumps(result, ensure_ascii=False))
+        write_json(result)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -1,35 +1,74 @@
 #!/usr/bin/env python3
 """
 Generate formatted DOCX from thesis JSON data with table and image support.
-Usage: python generate_docx.py <input.json> <output.docx> [--images-dir <dir>] [--template <template.docx>]
+Usage: python generate_docx.py <input.json> <output.docx> [--images-dir <dir>] [--template <template.docx>] [--fast-save]
+       python generate_docx.py --batch <manifest.json> [--workers N]
 """
 
 import json
 import sys
 import os
+import re
 import argparse
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
 from io import BytesIO
+from typing import Any, List, TypedDict
 from docx import Document
 from docx.shared import Pt, Inches, Cm, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.ns import qn, nsmap
-from docx.oxml import OxmlElement
-
-
-def set_chinese_font(run, font_name='宋体', size=12, bold=False):
-    """Set Chinese font for a run"""
-    run.font.name = font_name
-    run.font.size = Pt(size)
-    run.font.bold = bold
-    # Set East Asian font
-    r = run._element
-    rPr = r.get_or_add_rPr()
-    rFonts = OxmlElement('w:rFonts')
-    rFonts.set(qn('w:eastAsia'), font_name)
-    rFonts.set(qn('w:ascii'), font_name if font_name in ['宋体', '黑体', '楷体'] else 'Times New Roman')
-    rPr.insert(0, rFonts)
+from docx.oxml.ns import qn, nsmap, nsdecls
+from docx.oxml import OxmlElement, parse_xml
+
+from _docx_fast import (
+    FIRST_LINE_INDENT,
+    add_blank_paragraphs,
+    add_paragraph_chinese,
+    add_paragraphs_chinese,
+    add_table_from_data,
+    add_text_paragraphs,
+    append_body_elements,
+    fill_cell,
+    set_chinese_font,
+)
+
+try:
+    # python-docx internals used by save_docx() with a compression level
+    from docx.opc.pkgwriter import PackageWriter
+except ImportError:
+    PackageWriter = None
+
+try:
+    import msgspec  # Optional: schema-based JSON decoding
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+# Content placeholders: {%table_N%}, {%img_N%} and {%media_N%}
+_PLACEHOLDER_RE = re.compile(r'\{%(table|img|media)_(\d+)%\}')
+
+# Lengths used throughout the document, built once
+_PT6 = Pt(6)
+_PT12 = Pt(12)
+_PT18 = Pt(18)
+_CM_MARGIN_TB = Cm(2.54)
+_CM_MARGIN_LR = Cm(3.17)
+_CM_LABEL_COL = Cm(4)
+_CM_VALUE_COL = Cm(6)
+
+# zlib level used by --fast-save
+FAST_SAVE_COMPRESSLEVEL = 1
+
+# (template path, mtime) -> cleared template bytes handed to --batch workers
+_PREPARED_TEMPLATES = {}
 
 
 def set_cell_shading(cell, color):
@@ -51,71 +90,27 @@ def add_heading_chinese(doc, text, level, font_name='黑体', size=None, center=
     set_chinese_font(run, font_name, size, bold=True)
 
     # Add spacing
-    p.paragraph_format.space_before = Pt(18 if level <= 1 else 12)
-    p.paragraph_format.space_after = Pt(12 if level <= 1 else 6)
+    p.paragraph_format.space_before = _PT18 if level <= 1 else _PT12
+    p.paragraph_format.space_after = _PT12 if level <= 1 else _PT6
     p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
 
     return p
 
 
-def add_paragraph_chinese(doc, text, font_name='宋体', size=12, first_line_indent=True):
-    """Add a paragraph with Chinese font"""
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    set_chinese_font(run, font_name, size)
-
-    if first_line_indent:
-        p.paragraph_format.first_line_indent = Cm(0.74)  # 2 characters
-
-    p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
-    return p
-
-
-def add_table_from_data(doc, table_data, style='Table Grid'):
-    """Add a table from extracted table data"""
-    rows = table_data.get('rows', [])
-    if not rows:
-        return None
-
-    row_count = len(rows)
-    col_count = max(len(row) for row in rows) if rows else 0
-
-    if row_count == 0 or col_count == 0:
-        return None
-
-    table = doc.add_table(rows=row_count, cols=col_count)
-    table.style = style
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-
-    for i, row_data in enumerate(rows):
-        row = table.rows[i]
-        for j, cell_text in enumerate(row_data):
-            if j < len(row.cells):
-                cell = row.cells[j]
-                cell.text = ''
-                p = cell.paragraphs[0]
-                run = p.add_run(str(cell_text))
-                set_chinese_font(run, '宋体', 10)
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    # Add spacing after table
-    doc.add_paragraph()
-
-    return table
-
-
-def add_image_from_file(doc, image_path, width_inches=5, caption=None):
-    """Add an image from file"""
-    if not os.path.exists(image_path):
+def add_image_from_file(doc, image_path, width_inches=5, caption=None, check_exists=True):
+    """Add an image from file (check_exists=False when the caller already checked)"""
+    if check_exists and not os.path.exists(image_path):
         print(f"Warning: Image not found: {image_path}")
         return None
 
     try:
-        doc.add_picture(image_path, width=Inches(width_inches))
+        # Same as doc.add_picture(), but keeps the paragraph instead of
+        # finding it again through doc.paragraphs (a walk of the whole body)
+        p = doc.add_paragraph()
+        p.add_run().add_picture(image_path, width=Inches(width_inches))
 
         # Center the image
-        last_paragraph = doc.paragraphs[-1]
-        last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         # Add caption if provided
         if caption:
@@ -133,10 +128,10 @@ def add_image_from_file(doc, image_path, width_inches=5, caption=None):
 def add_image_from_buffer(doc, image_buffer, width_inches=5, caption=None):
     """Add an image from buffer"""
     try:
-        doc.add_picture(BytesIO(image_buffer), width=Inches(width_inches))
+        p = doc.add_paragraph()
+        p.add_run().add_picture(BytesIO(image_buffer), width=Inches(width_inches))
 
-        last_paragraph = doc.paragraphs[-1]
-        last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         if caption:
             p = doc.add_paragraph()
@@ -150,68 +145,162 @@ def add_image_from_buffer(doc, image_buffer, width_inches=5, caption=None):
         return None
 
 
-def generate_thesis_docx(data, output_path, images_dir=None, template_path=None):
+def list_dir_names(path):
+    """Return the set of entry names in a directory (empty if it cannot be read)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+# Cover page layout around the metadata table, as WordprocessingML written
+# out once; generate_thesis_docx copies these fragments instead of building
+# ~15 paragraphs through python-docx. Variable text goes into the last run
+# of a fragment (run.text handles escaping, tabs and line breaks).
+_HEITI_BOLD_RPR = ('<w:rPr><w:rFonts w:eastAsia="黑体" w:ascii="黑体"/>'
+                   '<w:rFonts w:ascii="黑体" w:hAnsi="黑体"/><w:b/><w:sz w:val="{half_points}"/></w:rPr>')
+_CENTERED_P = '<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r>{rpr}{text}</w:r></w:p>'
+_COVER_XML = {
+    'head': (
+        '<w:p/><w:p/>'
+        + _CENTERED_P.format(rpr=_HEITI_BOLD_RPR.format(half_points=72), text='<w:t>上海交通大学</w:t>')
+        + '<w:p/>'
+        + _CENTERED_P.format(rpr=_HEITI_BOLD_RPR.format(half_points=48), text='<w:t>本科毕业论文</w:t>')
+        + '<w:p/><w:p/>'
+        + _CENTERED_P.format(rpr=_HEITI_BOLD_RPR.format(half_points=44), text='')
+    ),
+    'title_en': '<w:p/>' + _CENTERED_P.format(
+        rpr='<w:rPr><w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman"/>'
+            '<w:b/><w:sz w:val="32"/></w:rPr>',
+        text=''),
+    'blank3': '<w:p/><w:p/><w:p/>',
+    'blank2': '<w:p/><w:p/>',
+    'date': _CENTERED_P.format(
+        rpr='<w:rPr><w:rFonts w:eastAsia="宋体" w:ascii="宋体"/><w:rFonts w:ascii="宋体" w:hAnsi="宋体"/>'
+            '<w:b w:val="0"/><w:sz w:val="28"/></w:rPr>',
+        text=''),
+    'page_break': '<w:p><w:r><w:br w:type="page"/></w:r></w:p>',
+}
+_COVER_PROTOTYPES = {
+    key: list(parse_xml(f'<w:body {nsdecls("w")}>{xml}</w:body>'))
+    for key, xml in _COVER_XML.items()
+}
+
+
+def as_run_text(value):
+    """Text for a fragment's run: None gives an empty run (as add_run(None) did), other values their str()"""
+    return '' if value is None else str(value)
+
+
+def cover_elements(key):
+    """Return fresh copies of the body elements of a cover page fragment"""
+    return [deepcopy(element) for element in _COVER_PROTOTYPES[key]]
+
+
+@lru_cache(maxsize=4)
+def _load_cleared_template(template_path, mtime):
+    """
+    Return the template as DOCX bytes with its body content removed.
+
+    Cached per (path, mtime) so repeated generations skip unzipping and
+    parsing the template and clearing its body; a modified template gets
+    a new mtime and is reloaded.
+    """
+    doc = Document(template_path)
+    # Clear template content but keep styles
+    for element in doc.element.body[:]:
+        doc.element.body.remove(element)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class _ZipWriter:
+    """python-docx physical package writer with a configurable deflate level"""
+
+    def __init__(self, pkg_file, compresslevel):
+        self._zipf = zipfile.ZipFile(pkg_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(pack_uri.membername, blob)
+
+    def close(self):
+        self._zipf.close()
+
+
+def save_docx(doc, output_path, compresslevel=None):
+    """
+    Save the document, optionally with a specific zlib compression level.
+
+    doc.save() always deflates at zlib's default level 6, which dominates the
+    save time of large documents; level 1 is several times faster for a
+    slightly bigger file. Mirrors OpcPackage.save() with its own zip writer;
+    as that relies on python-docx internals, it falls back to doc.save()
+    if they are missing or have changed.
+    """
+    if compresslevel is not None and PackageWriter is not None:
+        try:
+            _save_with_compresslevel(doc, output_path, compresslevel)
+            return
+        except (AttributeError, TypeError) as e:
+            print(f"Warning: Fast save unavailable ({e}), saving with default compression")
+    doc.save(output_path)
+
+
+def _save_with_compresslevel(doc, output_path, compresslevel):
+    """OpcPackage.save() with a _ZipWriter at the given compression level"""
+    package = doc.part.package
+    for part in package.parts:
+        part.before_marshal()
+    writer = _ZipWriter(output_path, compresslevel)
+    try:
+        PackageWriter._write_content_types_stream(writer, package.parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, package.parts)
+    finally:
+        writer.close()
+
+
+def generate_thesis_docx(data, output_path, images_dir=None, template_path=None, fast_save=False):
     """Generate DOCX from thesis data"""
 
     # Use template if provided, otherwise create new document
     if template_path and os.path.exists(template_path):
-        doc = Document(template_path)
-        # Clear template content but keep styles
-        for element in doc.element.body[:]:
-            doc.element.body.remove(element)
+        key = (template_path, os.path.getmtime(template_path))
+        template = _PREPARED_TEMPLATES.get(key)
+        if template is None:
+            template = _load_cleared_template(*key)
+        doc = Document(BytesIO(template))
     else:
         doc = Document()
 
     # Set page margins
     for section in doc.sections:
-        section.top_margin = Cm(2.54)
-        section.bottom_margin = Cm(2.54)
-        section.left_margin = Cm(3.17)
-        section.right_margin = Cm(3.17)
+        section.top_margin = _CM_MARGIN_TB
+        section.bottom_margin = _CM_MARGIN_TB
+        section.left_margin = _CM_MARGIN_LR
+        section.right_margin = _CM_MARGIN_LR
 
     metadata = data.get('metadata', {})
     tables = data.get('tables', [])
     images = data.get('images', [])
 
-    # === Cover Page ===
-    for _ in range(2):
-        doc.add_paragraph()
-
-    # University name
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run('上海交通大学')
-    set_chinese_font(run, '黑体', 36, bold=True)
-
-    doc.add_paragraph()
-
-    # Thesis type
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run('本科毕业论文')
-    set_chinese_font(run, '黑体', 24, bold=True)
-
-    for _ in range(2):
-        doc.add_paragraph()
+    # Read the images directory once instead of stat-ing every referenced file
+    available_images = list_dir_names(images_dir) if images_dir else set()
 
-    # Title
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run(metadata.get('title', '论文标题'))
-    set_chinese_font(run, '黑体', 22, bold=True)
+    # === Cover Page ===
+    # Static layout from pre-parsed XML; only the titles are filled in
+    cover = cover_elements('head')
+    cover[-1][-1].text = as_run_text(metadata.get('title', '论文标题'))
 
     # English title if present
     if metadata.get('title_en'):
-        doc.add_paragraph()
-        p = doc.add_paragraph()
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = p.add_run(metadata.get('title_en'))
-        run.font.name = 'Times New Roman'
-        run.font.size = Pt(16)
-        run.font.bold = True
+        title_en = cover_elements('title_en')
+        title_en[-1][-1].text = as_run_text(metadata.get('title_en'))
+        cover += title_en
 
-    for _ in range(3):
-        doc.add_paragraph()
+    append_body_elements(doc, cover + cover_elements('blank3'))
 
     # Metadata table
     info_items = [
@@ -222,48 +311,32 @@ def generate_thesis_docx(data, output_path, images_dir=None, template_path=None)
         ('学    院', metadata.get('school', '')),
     ]
 
+    # Only filled-in items get a row
+    active_items = [(label, value) for label, value in info_items if value]
+
     # Create a table for metadata
-    info_table = doc.add_table(rows=len([i for i in info_items if i[1]]), cols=2)
+    info_table = doc.add_table(rows=len(active_items), cols=2)
     info_table.alignment = WD_TABLE_ALIGNMENT.CENTER
 
-    row_idx = 0
-    for label, value in info_items:
-        if value:
-            row = info_table.rows[row_idx]
-            # Label cell
-            cell = row.cells[0]
-            cell.text = ''
-            p = cell.paragraphs[0]
-            run = p.add_run(f'{label}：')
-            set_chinese_font(run, '宋体', 14)
-            p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-
-            # Value cell
-            cell = row.cells[1]
-            cell.text = ''
-            p = cell.paragraphs[0]
-            run = p.add_run(value)
-            set_chinese_font(run, '宋体', 14)
-            p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-
-            row_idx += 1
+    for tr, (label, value) in zip(info_table._tbl.tr_lst, active_items):
+        label_tc, value_tc = tr.tc_lst
+        fill_cell(label_tc, f'{label}：', '宋体', 14, WD_ALIGN_PARAGRAPH.RIGHT)
+        fill_cell(value_tc, value, '宋体', 14, WD_ALIGN_PARAGRAPH.LEFT)
 
     # Set column widths
     for row in info_table.rows:
-        row.cells[0].width = Cm(4)
-        row.cells[1].width = Cm(6)
+        row.cells[0].width = _CM_LABEL_COL
+        row.cells[1].width = _CM_VALUE_COL
 
-    for _ in range(2):
-        doc.add_paragraph()
+    cover = cover_elements('blank2')
 
     # Date
     if metadata.get('date'):
-        p = doc.add_paragraph()
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = p.add_run(metadata.get('date'))
-        set_chinese_font(run, '宋体', 14)
+        date = cover_elements('date')
+        date[-1][-1].text = as_run_text(metadata.get('date'))
+        cover += date
 
-    doc.add_page_break()
+    append_body_elements(doc, cover + cover_elements('page_break'))
 
     # === Abstract ===
     if data.get('abstract'):
@@ -271,7 +344,7 @@ def generate_thesis_docx(data, output_path, images_dir=None, template_path=None)
         add_paragraph_chinese(doc, data['abstract'])
 
         if data.get('keywords'):
-            doc.add_paragraph()
+            add_blank_paragraphs(doc)
             p = doc.add_paragraph()
             run = p.add_run('关键词：')
             set_chinese_font(run, '黑体', 12, bold=True)
@@ -286,28 +359,28 @@ def generate_thesis_docx(data, output_path, images_dir=None, template_path=None)
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = p.add_run('ABSTRACT')
         run.font.name = 'Times New Roman'
-        run.font.size = Pt(18)
+        run.font.size = _PT18
         run.font.bold = True
-        p.paragraph_format.space_before = Pt(18)
-        p.paragraph_format.space_after = Pt(12)
+        p.paragraph_format.space_before = _PT18
+        p.paragraph_format.space_after = _PT12
 
         p = doc.add_paragraph()
         run = p.add_run(data['abstract_en'])
         run.font.name = 'Times New Roman'
-        run.font.size = Pt(12)
-        p.paragraph_format.first_line_indent = Cm(0.74)
+        run.font.size = _PT12
+        p.paragraph_format.first_line_indent = FIRST_LINE_INDENT
         p.paragraph_format.line_spacing_rule = WD_LINE_SPACING.ONE_POINT_FIVE
 
         if data.get('keywords_en'):
-            doc.add_paragraph()
+            add_blank_paragraphs(doc)
             p = doc.add_paragraph()
             run = p.add_run('Keywords: ')
             run.font.name = 'Times New Roman'
-            run.font.size = Pt(12)
+            run.font.size = _PT12
             run.font.bold = True
             run = p.add_run(data['keywords_en'])
             run.font.name = 'Times New Roman'
-            run.font.size = Pt(12)
+            run.font.size = _PT12
 
         doc.add_page_break()
 
@@ -338,33 +411,27 @@ def generate_thesis_docx(data, output_path, images_dir=None, template_path=None)
 
         # Add content paragraphs
         if content:
-            # Check for table placeholders like {%table_1%}
-            import re
-            parts = re.split(r'\{%table_(\d+)%\}', content)
-
-            for i, part in enumerate(parts):
-                if i % 2 == 0:
-                    # Text content
-                    paragraphs = part.split('\n\n')
-                    for para in paragraphs:
-                        if para.strip():
-                            add_paragraph_chinese(doc, para.strip())
-                else:
-                    # Table placeholder
-                    tbl_num = int(part)
+            # Walk the {%table_N%} / {%img_N%} placeholders in one pass,
+            # placing each table and image where it is referenced
+            last = 0
+            for match in _PLACEHOLDER_RE.finditer(content):
+                add_text_paragraphs(doc, content, last, match.start())
+                last = match.end()
+
+                kind, num = match.group(1), match.group(2)
+                if kind == 'table':
+                    tbl_num = int(num)
                     if tbl_num <= len(tables):
                         add_table_from_data(doc, tables[tbl_num - 1])
-
-            # Check for image placeholders like {%img_1%}
-            # Add images if referenced in content
-            img_matches = re.findall(r'\{%(?:img|media)_(\d+)%\}', content)
-            for img_num in img_matches:
-                idx = int(img_num) - 1
-                if idx < len(images) and images_dir:
-                    img_info = images[idx]
-                    img_path = os.path.join(images_dir, img_info.get('filename', ''))
-                    if os.path.exists(img_path):
-                        add_image_from_file(doc, img_path, caption=f"图 {img_num}")
+                else:
+                    idx = int(num) - 1
+                    if idx < len(images) and images_dir:
+                        img_info = images[idx]
+                        filename = img_info.get('filename', '')
+                        if filename in available_images:
+                            img_path = os.path.join(images_dir, filename)
+                            add_image_from_file(doc, img_path, caption=f"图 {num}", check_exists=False)
+            add_text_paragraphs(doc, content, last)
 
     # === Add remaining tables if not placed ===
     # (Tables that weren't referenced in content)
@@ -378,12 +445,11 @@ def generate_thesis_docx(data, output_path, images_dir=None, template_path=None)
         if isinstance(refs, str):
             # Split by newlines or reference numbers
             ref_lines = refs.strip().split('\n')
-            for line in ref_lines:
-                if line.strip():
-                    add_paragraph_chinese(doc, line.strip(), first_line_indent=False)
+            add_paragraphs_chinese(doc, (line.strip() for line in ref_lines if line.strip()),
+                                   first_line_indent=False)
         elif isinstance(refs, list):
-            for i, ref in enumerate(refs, 1):
-                add_paragraph_chinese(doc, f'[{i}] {ref}', first_line_indent=False)
+            add_paragraphs_chinese(doc, (f'[{i}] {ref}' for i, ref in enumerate(refs, 1)),
+                                   first_line_indent=False)
 
     # === Acknowledgements ===
     if data.get('acknowledgements'):
@@ -392,28 +458,171 @@ def generate_thesis_docx(data, output_path, images_dir=None, template_path=None)
         add_paragraph_chinese(doc, data['acknowledgements'])
 
     # Save
-    doc.save(output_path)
+    save_docx(doc, output_path, FAST_SAVE_COMPRESSLEVEL if fast_save else None)
     print(f'Generated: {output_path}')
     return output_path
 
 
+# The subset of the thesis JSON generate_thesis_docx reads. With msgspec,
+# the input is decoded against it: other keys are skipped during parsing
+# instead of being turned into Python objects. The result is still plain
+# dicts and lists, with absent keys left absent.
+class ThesisMetadata(TypedDict, total=False):
+    title: Any
+    title_en: Any
+    author_name: Any
+    student_id: Any
+    major: Any
+    supervisor: Any
+    school: Any
+    date: Any
+
+
+class ThesisSection(TypedDict, total=False):
+    level: Any
+    title: Any
+    content: Any
+
+
+class ThesisTable(TypedDict, total=False):
+    rows: Any
+
+
+class ThesisImage(TypedDict, total=False):
+    filename: Any
+
+
+class ThesisData(TypedDict, total=False):
+    metadata: ThesisMetadata
+    sections: List[ThesisSection]
+    tables: List[ThesisTable]
+    images: List[ThesisImage]
+    abstract: Any
+    keywords: Any
+    abstract_en: Any
+    keywords_en: Any
+    references: Any
+    acknowledgements: Any
+
+
+_thesis_decoder = msgspec.json.Decoder(ThesisData) if msgspec is not None else None
+
+
+def load_thesis_json(path):
+    """Load thesis data from a JSON file"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if _thesis_decoder is not None:
+        try:
+            return _thesis_decoder.decode(raw)
+        except msgspec.ValidationError:
+            # Unexpected shape (e.g. a null section list): parse it in full
+            # and let the generator deal with it as before
+            pass
+    return _parse_json(raw)
+
+
+def _parse_json(raw):
+    """Parse JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def load_batch_manifest(path):
+    """
+    Load a --batch manifest: a JSON list of job objects, each with at least
+    input and output paths. Raises ValueError for any other shape.
+    """
+    with open(path, 'rb') as f:
+        jobs = _parse_json(f.read())
+    if not isinstance(jobs, list):
+        raise ValueError('batch manifest must be a JSON list of jobs')
+    for i, job in enumerate(jobs):
+        if not (isinstance(job, dict) and isinstance(job.get('input'), str)
+                and isinstance(job.get('output'), str)):
+            raise ValueError(f'batch manifest job {i} must be an object with "input" and "output" paths')
+    return jobs
+
+
+def _generate_job(job):
+    """Generate one DOCX of a batch; runs inside a worker process"""
+    return generate_thesis_docx(
+        load_thesis_json(job['input']),
+        job['output'],
+        images_dir=job.get('images_dir'),
+        template_path=job.get('template'),
+        fast_save=job.get('fast_save', False)
+    )
+
+
+def generate_batch(jobs, max_workers=None):
+    """
+    Generate several theses in parallel worker processes.
+
+    Each job is a dict with input and output paths and optional images_dir,
+    template and fast_save. python-docx work is pure Python, so processes
+    (not threads) are used.
+    """
+    # Prepare every template once up front and hand the bytes to the workers
+    # explicitly: spawned workers (the default on macOS and Windows) do not
+    # inherit this process's template cache
+    templates = {}
+    for template_path in {job.get('template') for job in jobs}:
+        if template_path and os.path.exists(template_path):
+            key = (template_path, os.path.getmtime(template_path))
+            templates[key] = _load_cleared_template(*key)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [_generate_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(templates,)) as executor:
+        return list(executor.map(_generate_job, jobs))
+
+
+def _init_batch_worker(templates):
+    """Worker initializer: use the templates prepared by the parent process"""
+    _PREPARED_TEMPLATES.update(templates)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate thesis DOCX from JSON data')
-    parser.add_argument('input', help='Input JSON file path')
-    parser.add_argument('output', help='Output DOCX file path')
+    parser.add_argument('input', nargs='?', help='Input JSON file path')
+    parser.add_argument('output', nargs='?', help='Output DOCX file path')
     parser.add_argument('--images-dir', help='Directory containing extracted images')
     parser.add_argument('--template', help='Word template file for styling')
+    parser.add_argument('--fast-save', action='store_true',
+                        help='Save with fast, lighter zip compression (larger file)')
+    parser.add_argument('--batch', metavar='MANIFEST',
+                        help='JSON list of jobs ({"input", "output", "images_dir", "template"}) '
+                             'to generate in parallel instead of input/output')
+    parser.add_argument('--workers', type=int, help='Worker processes for --batch (default: CPU count)')
 
     args = parser.parse_args()
 
-    with open(args.input, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if args.batch:
+        try:
+            jobs = load_batch_manifest(args.batch)
+        except (OSError, ValueError) as e:
+            parser.error(f'--batch: {e}')
+        for job in jobs:
+            # Command-line options apply to jobs that do not set their own
+            job.setdefault('images_dir', args.images_dir)
+            job.setdefault('template', args.template)
+            job.setdefault('fast_save', args.fast_save)
+        generate_batch(jobs, args.workers)
+        return
+
+    if not args.input or not args.output:
+        parser.error('input and output are required unless --batch is given')
 
     generate_thesis_docx(
-        data,
+        load_thesis_json(args.input),
         args.output,
         images_dir=args.images_dir,
-        template_path=args.template
+        template_path=args.template,
+        fast_save=args.fast_save
     )
 
 
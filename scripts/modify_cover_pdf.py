@@ -2,13 +2,39 @@
 """
 Cover PDF modification script using PyMuPDF (fitz)
 Modifies the NJU thesis cover template with thesis metadata
+
+Usage: python modify_cover_pdf.py <input.pdf> <output.pdf> <data.json> [font_dir]
+       python modify_cover_pdf.py --stdout <input.pdf> <data.json> [font_dir]
+
+With --stdout the PDF is not written to disk: stdout carries its length as
+an 8-byte big-endian integer followed by the PDF bytes, and the result JSON
+is printed to stderr (as its last line) instead of stdout.
 """
 
+from __future__ import annotations
+
 import sys
 import json
 import os
-import fitz  # PyMuPDF
-from typing import Optional, Dict, Any, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF, imported at runtime by _import_fitz()
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+
+def _import_fitz() -> None:
+    """
+    Import PyMuPDF on first use. Loading the MuPDF library dominates the
+    script's startup, so invocations that fail argument or data checks
+    never pay for it.
+    """
+    global fitz
+    import fitz  # PyMuPDF
 
 
 class CoverPdfModifier:
@@ -17,14 +43,14 @@ class CoverPdfModifier:
     # Page 1: Fixed x position for field values (after the colon, on the underline)
     PAGE1_VALUE_X = 200  # Where to start inserting values on Page 1
 
-    # Page 1 field labels
-    PAGE1_LABELS = {
-        'title': '论文题目',
-        'author': '作者姓名',
-        'major': '专业名称',
-        'researchDirection': '研究方向',
-        'supervisor': '导师姓名',
-    }
+    # Page 1 fields as (data key, label) pairs, in the order they are filled
+    PAGE1_FIELDS: Tuple[Tuple[str, str], ...] = (
+        ('title', '论文题目'),
+        ('author', '作者姓名'),
+        ('major', '专业名称'),
+        ('researchDirection', '研究方向'),
+        ('supervisor', '导师姓名'),
+    )
 
     # Page 3 placeholder texts to replace (will be centered)
     PAGE3_PLACEHOLDERS = {
@@ -38,18 +64,43 @@ class CoverPdfModifier:
         'supervisor': '导师：',
     }
 
+    # Chinese font file names looked for in each font directory, in order
+    CHINESE_FONT_FILES = ('simsun.ttc', 'simsun.ttf', 'SimSun.ttc', 'SimSun.ttf')
+
     # Page width for centering calculations
     PAGE_WIDTH = 595.3
 
-    def __init__(self, input_pdf: str, output_pdf: str, font_dir: str = "."):
+    # Drop unused objects (e.g. redacted content) and compress the
+    # rewritten streams in the same pass as writing the PDF
+    SAVE_OPTIONS: Dict[str, Any] = {"garbage": 3, "deflate": True, "clean": True}
+
+    __slots__ = (
+        'input_pdf', 'output_pdf', 'font_dir', 'doc', 'pdf_bytes',
+        '_chinese_font_path', '_chinese_font_buffer', '_page_search_cache',
+        '_textpages', '_font_pages', '_pending_replacements',
+    )
+
+    def __init__(self, input_pdf: str, output_pdf: Optional[str], font_dir: str = "."):
         self.input_pdf = input_pdf
+        # None keeps the saved PDF in memory, as pdf_bytes
         self.output_pdf = output_pdf
         self.font_dir = font_dir
         self.doc: Optional[fitz.Document] = None
+        self.pdf_bytes: Optional[bytes] = None
         self._chinese_font_path: Optional[str] = None
+        self._chinese_font_buffer: Optional[bytes] = None
+        # page number -> {search text: search_for hits}; reset when a page's text is redacted
+        self._page_search_cache: Dict[int, Dict[str, List[fitz.Rect]]] = {}
+        # page number -> TextPage shared by all searches on that page
+        self._textpages: Dict[int, fitz.TextPage] = {}
+        # page numbers whose resources already hold the "simsun" font
+        self._font_pages: set = set()
+        # page number -> queued (rect, new text, use English font, font size) replacements
+        self._pending_replacements: Dict[int, List[Tuple[fitz.Rect, str, bool, float]]] = {}
 
     def load_document(self) -> None:
         """Load the PDF document"""
+        _import_fitz()
         self.doc = fitz.open(self.input_pdf)
 
         # Find Chinese font - check multiple directories
@@ -61,11 +112,15 @@ class CoverPdfModifier:
         ]
 
         for search_dir in font_search_dirs:
-            if not os.path.exists(search_dir):
+            # One directory listing instead of a stat per candidate file
+            try:
+                with os.scandir(search_dir) as entries:
+                    existing = {entry.name for entry in entries}
+            except OSError:
                 continue
-            for font_file in ['simsun.ttc', 'simsun.ttf', 'SimSun.ttc', 'SimSun.ttf']:
-                font_path = os.path.join(search_dir, font_file)
-                if os.path.exists(font_path):
+            for font_file in self.CHINESE_FONT_FILES:
+                if font_file in existing:
+                    font_path = os.path.join(search_dir, font_file)
                     self._chinese_font_path = font_path
                     print(f"Found font: {font_path}", file=sys.stderr)
                     break
@@ -75,13 +130,48 @@ class CoverPdfModifier:
         if not self._chinese_font_path:
             print("Warning: No Chinese font found, text insertion may fail", file=sys.stderr)
 
+    def _register_chinese_font(self, page: fitz.Page) -> None:
+        """
+        Add the Chinese font to a page's resources as "simsun" on first use,
+        so every later insert on that page refers to it by name only instead
+        of passing the font file again.
+        """
+        if self._chinese_font_path and page.number not in self._font_pages:
+            if self._chinese_font_buffer is None:
+                # Read the (large) font file once for all pages
+                with open(self._chinese_font_path, 'rb') as f:
+                    self._chinese_font_buffer = f.read()
+            page.insert_font(fontname="simsun", fontbuffer=self._chinese_font_buffer)
+            self._font_pages.add(page.number)
+
     def _find_text_rect(self, page: fitz.Page, search_text: str) -> Optional[fitz.Rect]:
         """Find the bounding rectangle of text on a page"""
-        text_instances = page.search_for(search_text)
+        page_cache = self._page_search_cache.setdefault(page.number, {})
+        text_instances = page_cache.get(search_text)
+        if text_instances is None:
+            text_instances = page_cache[search_text] = page.search_for(
+                search_text, textpage=self._get_textpage(page))
         if text_instances:
             return text_instances[0]
         return None
 
+    def _get_textpage(self, page: fitz.Page) -> fitz.TextPage:
+        """Extract the page's text once and reuse it for every search on that page"""
+        textpage = self._textpages.get(page.number)
+        if textpage is None:
+            # The flags page.search_for() extracts its own TextPage with
+            flags = (fitz.TEXT_DEHYPHENATE | fitz.TEXT_PRESERVE_WHITESPACE
+                     | fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_MEDIABOX_CLIP)
+            textpage = self._textpages[page.number] = page.get_textpage(flags=flags)
+        return textpage
+
+    def _invalidate_page_text(self, page: fitz.Page) -> None:
+        """Forget the extracted text and search hits of a page whose text changed"""
+        self._textpages.pop(page.number, None)
+        self._page_search_cache.pop(page.number, None)
+        # Redaction also drops font resources the page no longer uses
+        self._font_pages.discard(page.number)
+
     def _get_text_end_position(self, page: fitz.Page, search_text: str) -> Optional[Tuple[float, float]]:
         """Get the position right after a text label"""
         rect = self._find_text_rect(page, search_text)
@@ -96,14 +186,20 @@ class CoverPdfModifier:
         rect: fitz.Rect,
         text: str,
         font_size: float,
-        align: int = fitz.TEXT_ALIGN_CENTER,
+        align: int = 1,  # fitz.TEXT_ALIGN_CENTER
         fontname: str = "simsun",
-        fontfile: Optional[str] = None
+        fontfile: Optional[str] = None,
+        shape: Optional[fitz.Shape] = None
     ) -> bool:
-        """Insert text in a rectangle with alignment support"""
+        """
+        Insert text in a rectangle with alignment support. With a shape of
+        the page, the text is only drawn into it and written on its commit().
+        """
         try:
+            if fontname == "simsun" and fontfile is None:
+                self._register_chinese_font(page)
             # Use textbox for proper alignment
-            page.insert_textbox(
+            (shape or page).insert_textbox(
                 rect,
                 text,
                 fontsize=font_size,
@@ -129,17 +225,17 @@ class CoverPdfModifier:
 
         try:
             if self._chinese_font_path:
+                self._register_chinese_font(page)
                 page.insert_text(
-                    fitz.Point(point[0], point[1]),
+                    point,
                     text,
                     fontsize=font_size,
-                    fontfile=self._chinese_font_path,
                     fontname="simsun",
                 )
             else:
                 # Fallback: use default font (may not render Chinese well)
                 page.insert_text(
-                    fitz.Point(point[0], point[1]),
+                    point,
                     text,
                     fontsize=font_size,
                     fontname="helv",
@@ -162,7 +258,7 @@ class CoverPdfModifier:
 
         try:
             page.insert_text(
-                fitz.Point(point[0], point[1]),
+                point,
                 text,
                 fontsize=font_size,
                 fontname="tiro",  # Times-Roman equivalent
@@ -172,7 +268,7 @@ class CoverPdfModifier:
             print(f"Warning: Failed to insert text '{text[:20]}...': {e}", file=sys.stderr)
             return False
 
-    def _replace_text_centered(
+    def _queue_centered_replacement(
         self,
         page: fitz.Page,
         old_text: str,
@@ -180,7 +276,10 @@ class CoverPdfModifier:
         use_english_font: bool = False,
         font_size: float = 14
     ) -> bool:
-        """Replace text and center the new text on the page using textbox"""
+        """
+        Locate old_text and queue its replacement by new_text, centered on the
+        page. Nothing changes until _flush_replacements(page) is called.
+        """
         if not new_text:
             return False
 
@@ -190,34 +289,51 @@ class CoverPdfModifier:
             print(f"Warning: Could not find text '{old_text}' on page", file=sys.stderr)
             return False
 
-        # Store y position before redaction
-        y0 = text_rect.y0
-        y1 = text_rect.y1
-        height = y1 - y0
+        self._pending_replacements.setdefault(page.number, []).append(
+            (text_rect, new_text, use_english_font, font_size))
+        return True
 
-        # Add redaction annotation to remove old text
-        page.add_redact_annot(text_rect)
-        page.apply_redactions()
+    def _flush_replacements(self, page: fitz.Page) -> int:
+        """
+        Redact all queued texts of a page with a single apply_redactions()
+        (each call rewrites the page's content stream), then insert their
+        centered replacements. Returns the number of texts inserted.
+        """
+        pending = self._pending_replacements.pop(page.number, [])
+        if not pending:
+            return 0
 
-        # Create a full-width rectangle at the same y position for centered text
-        # Use page margins (50pt on each side)
-        new_rect = fitz.Rect(50, y0, self.PAGE_WIDTH - 50, y0 + height + 5)
-
-        # Insert new text centered in the rectangle
-        if use_english_font:
-            return self._insert_text_in_box(
-                page, new_rect, new_text, font_size,
-                align=fitz.TEXT_ALIGN_CENTER,
-                fontname="tiro",
-                fontfile=None
-            )
-        else:
-            return self._insert_text_in_box(
-                page, new_rect, new_text, font_size,
-                align=fitz.TEXT_ALIGN_CENTER,
-                fontname="simsun",
-                fontfile=self._chinese_font_path
-            )
+        # Add redaction annotations to remove the old texts
+        for text_rect, _, _, _ in pending:
+            page.add_redact_annot(text_rect)
+        page.apply_redactions()
+        # The page text changed; earlier search hits may be stale
+        self._invalidate_page_text(page)
+
+        inserted = 0
+        for text_rect, new_text, use_english_font, font_size in pending:
+            # Create a full-width rectangle at the same y position for centered text
+            # Use page margins (50pt on each side)
+            new_rect = fitz.Rect(50, text_rect.y0, self.PAGE_WIDTH - 50, text_rect.y1 + 5)
+
+            # Insert new text centered in the rectangle
+            if use_english_font:
+                ok = self._insert_text_in_box(
+                    page, new_rect, new_text, font_size,
+                    align=fitz.TEXT_ALIGN_CENTER,
+                    fontname="tiro",
+                    fontfile=None
+                )
+            else:
+                ok = self._insert_text_in_box(
+                    page, new_rect, new_text, font_size,
+                    align=fitz.TEXT_ALIGN_CENTER,
+                    fontname="simsun",
+                    fontfile=None
+                )
+            if ok:
+                inserted += 1
+        return inserted
 
     def modify_page1(self, data: Dict[str, Any]) -> int:
         """
@@ -227,47 +343,51 @@ class CoverPdfModifier:
         if not self.doc or self.doc.page_count < 1:
             return 0
 
+        # (value, PDF label) for every field that has a value; with none,
+        # the page is not even loaded
+        fields = [(data[key], label) for key, label in self.PAGE1_FIELDS if data.get(key)]
+        if not fields:
+            return 0
+
         page = self.doc[0]
         modified_count = 0
 
-        # Field mapping from input data to PDF labels
-        field_mapping = {
-            'title': data.get('title', ''),
-            'author': data.get('author', ''),
-            'major': data.get('major', ''),
-            'researchDirection': data.get('researchDirection', ''),
-            'supervisor': data.get('supervisor', ''),
-        }
+        # Every value box spans the same x range; only its y follows the label
+        value_x0 = self.PAGE1_VALUE_X
+        value_x1 = self.PAGE_WIDTH - 60  # Right margin
 
-        for field_name, value in field_mapping.items():
-            if not value:
-                continue
-
-            label = self.PAGE1_LABELS.get(field_name)
-            if not label:
-                continue
+        find_text_rect = self._find_text_rect
+        insert_text_in_box = self._insert_text_in_box
+        # All values are drawn into one shape and appended to the page
+        # as a single content stream, instead of one stream per field
+        shape = page.new_shape()
 
+        for value, label in fields:
             # Find the label to get the y position
-            label_rect = self._find_text_rect(page, label)
+            label_rect = find_text_rect(page, label)
             if label_rect:
                 # Create a textbox from the value start position to the right margin
                 # The value area starts after the label (with some padding)
                 value_rect = fitz.Rect(
-                    self.PAGE1_VALUE_X,           # Start x
+                    value_x0,                      # Start x
                     label_rect.y0,                 # Same y as label
-                    self.PAGE_WIDTH - 60,          # Right margin
+                    value_x1,                      # Right margin
                     label_rect.y1 + 5              # Bottom with padding
                 )
-                if self._insert_text_in_box(
+                if insert_text_in_box(
                     page, value_rect, value, font_size=12,
                     align=fitz.TEXT_ALIGN_LEFT,
                     fontname="simsun",
-                    fontfile=self._chinese_font_path
+                    fontfile=None,
+                    shape=shape
                 ):
                     modified_count += 1
             else:
                 print(f"Warning: Could not find label '{label}' on Page 1", file=sys.stderr)
 
+        if modified_count:
+            shape.commit()
+
         return modified_count
 
     def modify_page3(self, data: Dict[str, Any]) -> int:
@@ -279,25 +399,30 @@ class CoverPdfModifier:
             print("Warning: Document doesn't have page 3", file=sys.stderr)
             return 0
 
+        title_cn = data.get('title', '')
+        title_en = data.get('titleEn', '')
+        author = data.get('author', '')
+        supervisor = data.get('supervisor', '')
+        if not (title_cn or title_en or author or supervisor):
+            return 0
+
         page = self.doc[2]  # 0-indexed, page 3
         modified_count = 0
 
         # Chinese title replacement (centered)
-        title_cn = data.get('title', '')
         if title_cn:
-            if self._replace_text_centered(page, self.PAGE3_PLACEHOLDERS['title'], title_cn,
-                                           use_english_font=False, font_size=22):
-                modified_count += 1
+            self._queue_centered_replacement(page, self.PAGE3_PLACEHOLDERS['title'], title_cn,
+                                             use_english_font=False, font_size=22)
 
         # English title replacement (centered, Times New Roman)
-        title_en = data.get('titleEn', '')
         if title_en:
-            if self._replace_text_centered(page, self.PAGE3_PLACEHOLDERS['titleEn'], title_en,
-                                           use_english_font=True, font_size=18):
-                modified_count += 1
+            self._queue_centered_replacement(page, self.PAGE3_PLACEHOLDERS['titleEn'], title_en,
+                                             use_english_font=True, font_size=18)
+
+        # Both titles are redacted in one content stream rewrite
+        modified_count += self._flush_replacements(page)
 
         # Author name - insert after "作者："
-        author = data.get('author', '')
         if author:
             position = self._get_text_end_position(page, self.PAGE3_LABELS['author'])
             if position:
@@ -305,7 +430,6 @@ class CoverPdfModifier:
                     modified_count += 1
 
         # Supervisor name - insert after "导师："
-        supervisor = data.get('supervisor', '')
         if supervisor:
             position = self._get_text_end_position(page, self.PAGE3_LABELS['supervisor'])
             if position:
@@ -315,10 +439,16 @@ class CoverPdfModifier:
         return modified_count
 
     def save(self) -> None:
-        """Save the modified PDF"""
+        """Save the modified PDF to output_pdf, or to pdf_bytes if it is None"""
         if self.doc:
-            self.doc.save(self.output_pdf)
-            self.doc.close()
+            self._textpages.clear()
+            try:
+                if self.output_pdf is None:
+                    self.pdf_bytes = self.doc.tobytes(**self.SAVE_OPTIONS)
+                else:
+                    self.doc.save(self.output_pdf, **self.SAVE_OPTIONS)
+            finally:
+                self.doc.close()
 
     def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Main processing method"""
@@ -337,19 +467,47 @@ class CoverPdfModifier:
         }
 
 
+def load_data(data_json: str) -> Dict[str, Any]:
+    """Parse the metadata JSON file straight from its UTF-8 bytes"""
+    with open(data_json, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_framed(out, data: bytes) -> None:
+    """Write data to a binary stream, preceded by its length as 8 big-endian bytes"""
+    out.write(len(data).to_bytes(8, 'big'))
+    out.write(data)
+    out.flush()
+
+
 def main():
     """CLI entry point"""
-    if len(sys.argv) < 4:
+    args = sys.argv[1:]
+    to_stdout = '--stdout' in args
+    if to_stdout:
+        args = [arg for arg in args if arg != '--stdout']
+        # stdout carries only the framed PDF; everything printed (the result
+        # JSON, and any library messages) goes to stderr
+        pdf_out = sys.stdout.buffer
+        sys.stdout = sys.stderr
+
+    if len(args) < (2 if to_stdout else 3):
         print(
-            "Usage: python modify_cover_pdf.py <input.pdf> <output.pdf> <data.json> [font_dir]",
+            "Usage: python modify_cover_pdf.py <input.pdf> <output.pdf> <data.json> [font_dir]\n"
+            "       python modify_cover_pdf.py --stdout <input.pdf> <data.json> [font_dir]",
             file=sys.stderr
         )
         sys.exit(1)
 
-    input_pdf = sys.argv[1]
-    output_pdf = sys.argv[2]
-    data_json = sys.argv[3]
-    font_dir = sys.argv[4] if len(sys.argv) > 4 else "."
+    if to_stdout:
+        input_pdf, data_json, *rest = args
+        output_pdf = None
+    else:
+        input_pdf, output_pdf, data_json, *rest = args
+    font_dir = rest[0] if rest else "."
 
     # Validate input file exists
     if not os.path.exists(input_pdf):
@@ -358,15 +516,14 @@ def main():
 
     # Load metadata
     try:
-        with open(data_json, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_data(data_json)
     except Exception as e:
         print(json.dumps({"success": False, "error": f"Failed to load data JSON: {e}"}))
         sys.exit(1)
 
     # Create output directory if needed
-    output_dir = os.path.dirname(output_pdf)
-    if output_dir and not os.path.exists(output_dir):
+    output_dir = os.path.dirname(output_pdf) if output_pdf else None
+    if output_dir:
         os.makedirs(output_dir, exist_ok=True)
 
     # Process PDF
@@ -374,6 +531,8 @@ def main():
 
     try:
         result = modifier.process(data)
+        if to_stdout:
+            write_framed(pdf_out, modifier.pdf_bytes)
         print(json.dumps(result, ensure_ascii=False))
     except Exception as e:
         print(json.dumps({"success": False, "error": str(e)}))